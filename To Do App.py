@@ -2,15 +2,70 @@ import streamlit as st
 import sqlite3
 from datetime import datetime, date
 from typing import List, Tuple, Optional, Dict
-import json
+import orjson
 import pandas as pd
+import xlsxwriter
 import io
+import csv
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from collections import Counter
+try:
+    import simdjson
+except ImportError:  # optional; orjson handles every file without it
+    simdjson = None
 
 DB_PATH = "tasks.db"
+SIMDJSON_MIN_BYTES = 64 * 1024  # below this, per-field FFI lookups cost more than orjson's full parse
+
+# ----------------------- SQL -----------------------
+# Identical strings on every call hit sqlite3's per-connection statement cache
+SQL_INSERT_TASK = "INSERT INTO tasks(title,notes,due,priority,tags,done) VALUES (?,?,?,?,?,?)"
+SQL_IMPORT_TASK = """
+    INSERT INTO tasks(title, notes, due, priority, tags, done, created_at, updated_at)
+    VALUES (?,?,?,?,?,?,CURRENT_TIMESTAMP,CURRENT_TIMESTAMP)
+"""
+SQL_IMPORT_TASK_JSON = """
+    INSERT INTO tasks(id, title, notes, due, priority, tags, done, created_at, updated_at)
+    VALUES (?,?,?,?,?,?,?,?,?)
+"""
+SQL_UPDATE_TASK = "UPDATE tasks SET title=?, due=?, priority=?, tags=?, done=?, updated_at=CURRENT_TIMESTAMP WHERE id=?"
+SQL_SET_DONE = "UPDATE tasks SET done=?, updated_at=CURRENT_TIMESTAMP WHERE id=?"
+SQL_SET_NOTES = "UPDATE tasks SET notes=?, updated_at=CURRENT_TIMESTAMP WHERE id=?"
+SQL_DELETE = "DELETE FROM tasks WHERE id=?"
+SQL_SELECT_ALL = "SELECT id, title, notes, due, priority, tags, done, created_at, updated_at FROM tasks"
+SQL_SELECT_NOTES = "SELECT id, notes FROM tasks WHERE notes IS NOT NULL AND id IN (SELECT value FROM json_each(?))"
 
 # ----------------------- DB LAYER -----------------------
+@st.cache_resource(show_spinner=False)
+def _db():
+    # One shared autocommit connection; pragmas are per-connection so they only run once
+    con = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    con.row_factory = sqlite3.Row
+    con.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+        PRAGMA mmap_size=268435456;
+    """)
+    # ver counts writes made through this process; cached reads are keyed on it
+    return SimpleNamespace(con=con, lock=threading.RLock(), ver=0)
+
+@contextmanager
 def get_conn():
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
+    # Sessions share the connection; hold its lock so no write lands inside another thread's transaction
+    db = _db()
+    with db.lock:
+        yield db.con
+
+@contextmanager
+def _transaction():
+    # Explicit BEGIN on the locked connection; 'with con' commits it, or rolls it back on error
+    with get_conn() as con, con:
+        con.execute("BEGIN")
+        yield con
 
 def init_db():
     with get_conn() as con:
@@ -27,150 +82,313 @@ def init_db():
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """)
-        con.commit()
+        con.execute("CREATE INDEX IF NOT EXISTS idx_tasks_filter ON tasks(done, due, priority)")
+        # Full-text index over the searchable columns, kept in sync by triggers
+        has_fts = con.execute("SELECT 1 FROM sqlite_master WHERE name='tasks_fts'").fetchone()
+        con.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(title, notes, tags, content='tasks', content_rowid='id');
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts(rowid, title, notes, tags) VALUES (new.id, new.title, new.notes, new.tags);
+        END;
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, notes, tags) VALUES ('delete', old.id, old.title, old.notes, old.tags);
+        END;
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, notes, tags ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, notes, tags) VALUES ('delete', old.id, old.title, old.notes, old.tags);
+            INSERT INTO tasks_fts(rowid, title, notes, tags) VALUES (new.id, new.title, new.notes, new.tags);
+        END;
+        """)
+        if not has_fts:
+            con.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+        # Blank notes are stored as NULL so "has notes" is an IS NOT NULL check that never reads the text
+        if con.execute("PRAGMA user_version").fetchone()[0] < 1:
+            con.execute("UPDATE tasks SET notes=NULL WHERE trim(notes)=''")
+            con.execute("PRAGMA user_version=1")
 
 def to_tag_str(tags: List[str]) -> str:
-    clean = []
-    for t in tags:
-        t = t.strip().lower()
-        if t and t not in clean:
-            clean.append(t)
-    return ",".join(clean)
+    # dict.fromkeys de-duplicates in order with O(1) membership checks
+    return ",".join(dict.fromkeys(t.strip().lower() for t in tags if t.strip()))
 
 def parse_tags(s: str) -> List[str]:
     if not s: return []
     return [t.strip() for t in s.split(",") if t.strip()]
 
-def add_task(title: str, notes: str, due: Optional[date], priority: str, tags: List[str]):
+def _notes_or_none(notes) -> Optional[str]:
+    return notes if notes is not None and str(notes).strip() else None
+
+def _db_ver() -> int:
+    return _db().ver
+
+def _bump_db_ver():
+    # Any write invalidates cached reads for every session, since st.cache_data is process-wide
+    db = _db()
+    with db.lock:
+        db.ver += 1
+
+def add_task(title: str, notes: str, due: Optional[date], priority: str, tags: List[str], done: bool = False):
     with get_conn() as con:
-        con.execute("""
-        INSERT INTO tasks(title,notes,due,priority,tags,done) VALUES (?,?,?,?,?,0)
-        """, (title, notes, due.isoformat() if due else None, priority, to_tag_str(tags)))
-        con.commit()
+        con.execute(SQL_INSERT_TASK, (title, _notes_or_none(notes), due.isoformat() if due else None, priority, to_tag_str(tags), int(done)))
+    _bump_db_ver()
 
-def update_task(task_id: int, title: str, notes: str, due: Optional[date], priority: str, tags: List[str], done: bool):
+def update_tasks(rows: List[Tuple[int, str, Optional[str], str, str, bool]]):
+    # rows: (task_id, title, due ISO string or None, priority, tag string, done); notes are saved separately
     with get_conn() as con:
-        con.execute("""
-        UPDATE tasks SET title=?, notes=?, due=?, priority=?, tags=?, done=?, updated_at=CURRENT_TIMESTAMP
-        WHERE id=?
-        """, (title, notes, due.isoformat() if due else None, priority, to_tag_str(tags), int(done), task_id))
-        con.commit()
+        con.executemany(SQL_UPDATE_TASK, [(title, due, priority, tags, int(done), task_id) for task_id, title, due, priority, tags, done in rows])
+    _bump_db_ver()
+
+def set_done(rows: List[Tuple[int, bool]]):
+    # rows: (task_id, done)
+    with get_conn() as con:
+        con.executemany(SQL_SET_DONE, [(int(done), task_id) for task_id, done in rows])
+    _bump_db_ver()
+
+def set_notes(task_id: int, notes: str):
+    with get_conn() as con:
+        con.execute(SQL_SET_NOTES, (_notes_or_none(notes), task_id))
+    _bump_db_ver()
+
+def delete_tasks(task_ids: List[int]):
+    with get_conn() as con:
+        con.executemany(SQL_DELETE, [(tid,) for tid in task_ids])
+    _bump_db_ver()
 
-def delete_task(task_id: int):
+@st.cache_data(show_spinner=False, max_entries=16)
+def _list_tasks_cached(ver: int) -> List[Dict]:
     with get_conn() as con:
-        con.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-        con.commit()
+        cur = con.execute(SQL_SELECT_ALL)
+        # sqlite3.Row can't be pickled by st.cache_data, so copy into plain dicts here
+        return [dict(row) for row in cur]
 
 def list_tasks() -> List[Dict]:
+    return _list_tasks_cached(_db_ver())
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _get_notes_cached(task_ids: Tuple[int, ...], ver: int) -> Dict[int, str]:
     with get_conn() as con:
-        cur = con.execute("SELECT id, title, notes, due, priority, tags, done, created_at, updated_at FROM tasks")
-        cols = [c[0] for c in cur.description]
-        out = [dict(zip(cols, row)) for row in cur.fetchall()]
-        return out
+        cur = con.execute(SQL_SELECT_NOTES, (orjson.dumps(task_ids).decode(),))
+        return {row[0]: row[1] for row in cur}
+
+def get_notes(task_ids: List[int]) -> Dict[int, str]:
+    # One query for all requested tasks; tasks without notes are left out
+    return _get_notes_cached(tuple(task_ids), _db_ver())
 
 # ----------------------- IMPORT/EXPORT -----------------------
-def export_tasks_json() -> str:
+def export_tasks_json() -> bytes:
     rows = list_tasks()
-    return json.dumps(rows, indent=2, default=str)
+    return orjson.dumps(rows, default=str, option=orjson.OPT_INDENT_2)
 
 def import_tasks_json(file_bytes: bytes):
-    data = json.loads(file_bytes.decode("utf-8"))
-    assert isinstance(data, list)
-    with get_conn() as con:
-        for r in data:
-            con.execute("""
-            INSERT INTO tasks(id, title, notes, due, priority, tags, done, created_at, updated_at)
-            VALUES (?,?,?,?,?,?,?,?,?)
-            """, (
-                r.get("id"),
-                r.get("title"),
-                r.get("notes"),
-                r.get("due"),
-                r.get("priority","medium"),
-                r.get("tags",""),
-                int(r.get("done",0)),
-                r.get("created_at"),
-                r.get("updated_at"),
-            ))
-        con.commit()
+    if simdjson is not None and len(file_bytes) >= SIMDJSON_MIN_BYTES:
+        # Parser must stay alive while its documents are read, so keep it in scope
+        parser = simdjson.Parser()
+        data = parser.parse(file_bytes)
+        assert isinstance(data, simdjson.Array)
+    else:
+        data = orjson.loads(file_bytes)
+        assert isinstance(data, list)
+    records = [(
+        r.get("id"),
+        r.get("title"),
+        _notes_or_none(r.get("notes")),
+        r.get("due"),
+        r.get("priority","medium"),
+        r.get("tags",""),
+        int(r.get("done",0)),
+        r.get("created_at"),
+        r.get("updated_at"),
+    ) for r in data]
+    with _transaction() as con:
+        con.executemany(SQL_IMPORT_TASK_JSON, records)
+    _bump_db_ver()
+
+EXPORT_COLUMNS = ["id", "title", "notes", "due", "priority", "tags", "done", "created_at", "updated_at"]
 
 def export_tasks_csv() -> bytes:
-    df = pd.DataFrame(list_tasks())
-    return df.to_csv(index=False).encode("utf-8")
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(EXPORT_COLUMNS)
+    w.writerows([r[c] for c in EXPORT_COLUMNS] for r in list_tasks())
+    return buf.getvalue().encode("utf-8")
 
 def export_tasks_excel() -> bytes:
-    df = pd.DataFrame(list_tasks())
     output = io.BytesIO()
-    df.to_excel(output, index=False, engine="openpyxl")
+    wb = xlsxwriter.Workbook(output, {"in_memory": True})
+    ws = wb.add_worksheet()
+    ws.write_row(0, 0, EXPORT_COLUMNS)
+    for i, r in enumerate(list_tasks(), start=1):
+        ws.write_row(i, 0, [r[c] for c in EXPORT_COLUMNS])
+    wb.close()
     return output.getvalue()
 
+IMPORT_DEFAULTS = {"notes": None, "due": None, "priority": "medium", "tags": "", "done": 0}
+IMPORT_COLUMNS = ["title", *IMPORT_DEFAULTS]
+IMPORT_DTYPES = {"title": "string", "notes": "string", "priority": "string", "tags": "string", "done": "Int64"}
+CSV_BATCH_SIZE = 5000
+
+def _parse_done(v: Optional[str]) -> int:
+    # Accept the boolean spellings pandas used to parse as well as 0/1 (and 1.0 from spreadsheets)
+    v = (v or "").strip().lower()
+    if v in ("true", "yes"):
+        return 1
+    if v in ("", "false", "no"):
+        return 0
+    return int(float(v))
+
 def import_tasks_csv(file_bytes: bytes):
-    df = pd.read_csv(io.BytesIO(file_bytes))
-    _import_from_df(df)
+    # Stream rows straight into batched INSERTs; no DataFrame needed just to insert
+    reader = csv.DictReader(io.TextIOWrapper(io.BytesIO(file_bytes), encoding="utf-8-sig", newline=""))
+    reader.fieldnames = [c.strip().lower() for c in reader.fieldnames or []]
+    if "title" not in reader.fieldnames:
+        raise ValueError("CSV/Excel must include at least a 'title' column.")
+
+    with _transaction() as con:
+        batch = []
+        for r in reader:
+            batch.append((
+                r["title"] or None,
+                _notes_or_none(r.get("notes")),
+                r.get("due") or None,
+                r.get("priority") or "medium",
+                r.get("tags") or "",
+                _parse_done(r.get("done")),
+            ))
+            if len(batch) >= CSV_BATCH_SIZE:
+                con.executemany(SQL_IMPORT_TASK, batch)
+                batch.clear()
+        con.executemany(SQL_IMPORT_TASK, batch)
+    _bump_db_ver()
 
 def import_tasks_excel(file_bytes: bytes):
-    df = pd.read_excel(io.BytesIO(file_bytes))
+    # Read only the task columns with fixed dtypes so pandas skips type inference on the rest.
+    # Headers may be in any case, so map them to the lower-case names first.
+    header = pd.read_excel(io.BytesIO(file_bytes), engine="calamine", nrows=0).columns
+    wanted = {c: str(c).strip().lower() for c in header if str(c).strip().lower() in IMPORT_COLUMNS}
+    df = pd.read_excel(
+        io.BytesIO(file_bytes),
+        engine="calamine",
+        usecols=list(wanted),
+        dtype={c: IMPORT_DTYPES[name] for c, name in wanted.items() if name in IMPORT_DTYPES},
+    )
     _import_from_df(df)
 
 def _import_from_df(df):
+    df = df.rename(columns=lambda c: str(c).strip().lower())
     required_cols = {"title"}
-    if not required_cols.issubset(df.columns.str.lower()):
+    if not required_cols.issubset(df.columns):
         raise ValueError("CSV/Excel must include at least a 'title' column.")
 
-    with get_conn() as con:
-        for _, r in df.iterrows():
-            con.execute("""
-                INSERT INTO tasks(title, notes, due, priority, tags, done, created_at, updated_at)
-                VALUES (?,?,?,?,?,?,CURRENT_TIMESTAMP,CURRENT_TIMESTAMP)
-            """, (
-                r.get("title"),
-                r.get("notes") if "notes" in df.columns else "",
-                r.get("due") if "due" in df.columns else None,
-                r.get("priority") if "priority" in df.columns else "medium",
-                r.get("tags") if "tags" in df.columns else "",
-                int(r.get("done", 0)) if "done" in df.columns else 0,
-            ))
-        con.commit()
+    # Fill absent columns and blank cells with their defaults in bulk, then pull each column out once
+    df = df.assign(**{c: v for c, v in IMPORT_DEFAULTS.items() if c not in df.columns})
+    df = df.fillna({c: v for c, v in IMPORT_DEFAULTS.items() if v is not None})
+    df["done"] = df["done"].astype(int)
+    # .tolist() yields plain Python scalars; sqlite3 can't bind numpy types
+    df = df.astype(object).where(df.notna(), None)
+    # Excel date cells come back as Timestamps; store those as ISO dates and keep any other value as written
+    df["due"] = df["due"].map(lambda v: v.strftime("%Y-%m-%d") if isinstance(v, (datetime, date)) else v)
+    df["notes"] = df["notes"].map(_notes_or_none)
+    records = list(zip(*(df[c].tolist() for c in IMPORT_COLUMNS)))
+
+    with _transaction() as con:
+        con.executemany(SQL_IMPORT_TASK, records)
+    _bump_db_ver()
 
 # ----------------------- UI HELPERS -----------------------
 PRIORITY_ORDER = {"high": 3, "medium": 2, "low": 1}
 
-def status_of(t):
-    if t["done"]:
-        return "done"
-    if t["due"]:
-        try:
-            if date.fromisoformat(t["due"]) < date.today():
-                return "overdue"
-        except Exception:
-            pass
-    return "open"
-
-def filter_sort(tasks, q, status, pri, sort_by):
+PRIORITY_SQL = "CASE priority " + " ".join(f"WHEN '{k}' THEN {v}" for k, v in PRIORITY_ORDER.items()) + " ELSE 2 END"
+
+# Task status for the stats line and the table; takes local "today" rather than SQLite's UTC date('now')
+STATUS_SQL = "CASE WHEN done<>0 THEN 'done' WHEN date(due) < ? THEN 'overdue' ELSE 'open' END"
+# The same statuses as WHERE clauses, so open/overdue can use idx_tasks_filter; date() is NULL for non-ISO text
+STATUS_FILTER_SQL = {
+    "done": "done<>0",
+    "overdue": "done=0 AND date(due) < ?",
+    "open": "done=0 AND (date(due) IS NULL OR date(due) >= ?)",
+}
+
+ORDER_BY_SQL = {
+    "due": f" ORDER BY due IS NULL, due, {PRIORITY_SQL} DESC, id DESC",
+    "priority": f" ORDER BY {PRIORITY_SQL} DESC, COALESCE(due, '9999-12-31'), id DESC",
+    "created": " ORDER BY id DESC",
+}
+
+def filter_sort(q, status, pri, sort_by):
+    # LIKE is case-insensitive, so lower-casing the query only widens cache hits
     q = (q or "").strip().lower()
-    out = []
-    for t in tasks:
-        if status != "all" and status_of(t) != status:
-            continue
-        if pri != "all" and t["priority"] != pri:
+    return _filter_sort_cached(_db_ver(), date.today().isoformat(), q, status, pri, sort_by)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _filter_sort_cached(ver: int, today: str, q: str, status: str, pri: str, sort_by: str) -> List[Dict]:
+    sql = f"""
+        SELECT id, title, due, priority, tags, done, created_at, updated_at,
+               notes IS NOT NULL AS has_notes,
+               {STATUS_SQL} AS status
+        FROM tasks WHERE 1=1
+    """
+    params = [today]
+    if status != "all":
+        sql += " AND " + STATUS_FILTER_SQL[status]
+        if "?" in STATUS_FILTER_SQL[status]:
+            params.append(today)
+    if pri != "all":
+        sql += " AND priority=?"
+        params.append(pri)
+    if q:
+        # Every word must prefix-match in title/notes/tags; due dates are matched as plain text
+        match = " ".join('"' + w.replace('"', '""') + '"*' for w in q.split())
+        like = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        sql += " AND (id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?) OR due LIKE ? ESCAPE '\\')"
+        params += [match, like]
+
+    sql += ORDER_BY_SQL.get(sort_by, ORDER_BY_SQL["created"])
+
+    with get_conn() as con:
+        return [dict(row) for row in con.execute(sql, params)]
+
+def status_counts() -> Counter:
+    return Counter(_status_counts_cached(_db_ver(), date.today().isoformat()))
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _status_counts_cached(ver: int, today: str) -> Dict[str, int]:
+    with get_conn() as con:
+        cur = con.execute(f"SELECT {STATUS_SQL} AS status, COUNT(*) AS n FROM tasks GROUP BY status", (today,))
+        return {row["status"]: row["n"] for row in cur}
+
+def _iso_or_none(v) -> Optional[str]:
+    # data_editor reports edited dates as ISO strings; accept date objects too
+    if not v:
+        return None
+    return v.isoformat() if isinstance(v, date) else str(v)[:10]
+
+def _apply_task_edits(key: str, rows: List[Dict]):
+    """on_change callback for the task table: write only the rows the editor reports as changed."""
+    changes = st.session_state[key]
+    done_only, updates = [], []
+    for i, edit in changes["edited_rows"].items():
+        t = rows[int(i)]
+        if edit.keys() == {"done"}:
+            done_only.append((t["id"], edit["done"]))
             continue
-        if q:
-            hay = " ".join([
-                t["title"] or "", t["notes"] or "", t["tags"] or "", t.get("due") or ""
-            ]).lower()
-            if q not in hay:
-                continue
-        out.append(t)
-
-    if sort_by == "due":
-        out.sort(key=lambda t: (t["due"] is None, t["due"] or "9999-12-31", -PRIORITY_ORDER.get(t["priority"],2), -t["id"]))
-    elif sort_by == "priority":
-        out.sort(key=lambda t: (-PRIORITY_ORDER.get(t["priority"],2), t["due"] or "9999-12-31", -t["id"]))
-    elif sort_by == "created":
-        out.sort(key=lambda t: (-t["id"]))
-    else:
-        out.sort(key=lambda t: (-t["id"]))
-    return out
+        t = {**t, **edit}
+        updates.append((
+            t["id"],
+            (t["title"] or "").strip() or rows[int(i)]["title"],
+            _iso_or_none(t["due"]) if "due" in edit else rows[int(i)]["due"],
+            t["priority"] or "medium",
+            to_tag_str(parse_tags(t["tags"])),
+            bool(t["done"]),
+        ))
+    if done_only:
+        set_done(done_only)
+    if updates:
+        update_tasks(updates)
+    for r in changes["added_rows"]:
+        if (r.get("title") or "").strip():
+            due = _iso_or_none(r.get("due"))
+            add_task(r["title"].strip(), "", date.fromisoformat(due) if due else None,
+                     r.get("priority") or "medium", parse_tags(r.get("tags")), bool(r.get("done")))
+    if changes["deleted_rows"]:
+        delete_tasks([rows[int(i)]["id"] for i in changes["deleted_rows"]])
 
 def badge(text, help=None):
     st.markdown(f"<span style='padding:2px 8px;border-radius:999px;border:1px solid rgba(255,255,255,.25);font-size:12px'>{text}</span>", unsafe_allow_html=True)
@@ -238,51 +456,51 @@ with c3:
 with c4:
     sort_by = st.selectbox("Sort by", ["created","due","priority"], index=1)
 
-tasks = list_tasks()
-filtered = filter_sort(tasks, q, status, pri, sort_by)
+filtered = filter_sort(q, status, pri, sort_by)
 
 # Stats
-open_cnt = sum(1 for t in tasks if status_of(t) == "open")
-over_cnt = sum(1 for t in tasks if status_of(t) == "overdue")
-done_cnt = sum(1 for t in tasks if t["done"])
-st.caption(f"Open: {open_cnt} • Overdue: {over_cnt} • Done: {done_cnt} • Total: {len(tasks)}")
-
-# Task list
-for t in filtered:
-    with st.container(border=True):
-        cols = st.columns([0.07, 0.6, 0.33])
-        with cols[0]:
-            toggled = st.checkbox(" ", value=bool(t["done"]), key=f"done_{t['id']}")
-            if toggled != bool(t["done"]):
-                update_task(t["id"], t["title"], t["notes"], date.fromisoformat(t["due"]) if t["due"] else None, t["priority"], parse_tags(t["tags"]), toggled)
-                st.rerun()
-        with cols[1]:
-            title_view = f"~~{t['title']}~~" if t["done"] else t["title"]
-            st.markdown(f"**{title_view}**")
-            chip_cols = st.columns(4)
-            with chip_cols[0]:
-                st.caption(f"Priority: **{t['priority']}**")
-            with chip_cols[1]:
-                st.caption("Due: " + (t["due"] or "—"))
-            with chip_cols[2]:
-                st.caption("Tags: " + (t["tags"] or "—"))
-            with chip_cols[3]:
-                st.caption("Updated: " + (t["updated_at"] or "—"))
-            if t["notes"]:
-                with st.expander("Notes"):
-                    st.write(t["notes"])
-        with cols[2]:
-            with st.popover("Edit"):
-                nt = st.text_input("Title", value=t["title"], key=f"et_{t['id']}")
-                nd = st.date_input("Due", value=date.fromisoformat(t["due"]) if t["due"] else None, key=f"ed_{t['id']}")
-                np = st.selectbox("Priority", ["low","medium","high"], index=["low","medium","high"].index(t["priority"]), key=f"ep_{t['id']}")
-                ntag = st.text_input("Tags", value=t["tags"] or "", key=f"eg_{t['id']}")
-                nn = st.text_area("Notes", value=t["notes"] or "", key=f"en_{t['id']}")
-                if st.button("Save", key=f"sv_{t['id']}", type="primary"):
-                    update_task(t["id"], nt.strip() or t["title"], nn, nd, np, parse_tags(ntag), bool(t["done"]))
-                    st.success("Updated.")
-                    st.rerun()
-            st.button("🗑️ Delete", key=f"del_{t['id']}", on_click=lambda tid=t['id']: delete_task(tid))
+counts = status_counts()
+st.caption(f"Open: {counts['open']} • Overdue: {counts['overdue']} • Done: {counts['done']} • Total: {sum(counts.values())}")
+
+# Task list: one Arrow-backed table instead of a set of widgets per task
+df = pd.DataFrame(filtered, columns=["id", "done", "title", "status", "priority", "due", "tags", "has_notes", "created_at", "updated_at"])
+df["done"] = df["done"].astype(bool)
+df["has_notes"] = df["has_notes"].astype(bool)
+df["due"] = pd.to_datetime(df["due"], format="%Y-%m-%d", errors="coerce").dt.date
+# Keyed by db version so a fresh editor (with no pending edits) is shown after every write
+editor_key = f"tasks_editor_{_db_ver()}"
+st.data_editor(
+    df,
+    key=editor_key,
+    on_change=_apply_task_edits,
+    args=(editor_key, filtered),
+    num_rows="dynamic",
+    hide_index=True,
+    use_container_width=True,
+    column_order=["done", "title", "status", "priority", "due", "tags", "has_notes", "updated_at"],
+    column_config={
+        "done": st.column_config.CheckboxColumn("Done"),
+        "title": st.column_config.TextColumn("Title", required=True),
+        "status": st.column_config.TextColumn("Status"),
+        "priority": st.column_config.SelectboxColumn("Priority", options=["low","medium","high"], default="medium"),
+        "due": st.column_config.DateColumn("Due"),
+        "tags": st.column_config.TextColumn("Tags"),
+        "has_notes": st.column_config.CheckboxColumn("Notes"),
+        "updated_at": st.column_config.TextColumn("Updated"),
+    },
+    disabled=["id", "status", "has_notes", "created_at", "updated_at"],
+)
+
+# Notes are only fetched for the task picked here
+if filtered:
+    with st.expander("📝 Notes"):
+        titles = {t["id"]: t["title"] for t in filtered}
+        tid = st.selectbox("Task", list(titles), format_func=titles.get)
+        nn = st.text_area("Notes", value=get_notes([tid]).get(tid, ""), key=f"en_{tid}")
+        if st.button("Save notes", type="primary"):
+            set_notes(tid, nn)
+            st.success("Updated.")
+            st.rerun()
 
 # Quick add suggestions
 with st.expander("✨ Quick ideas"):